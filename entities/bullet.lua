@@ -5,6 +5,9 @@ Bullet.__index = Bullet
 Bullet.sprites = nil
 Bullet.animationSets = nil
 
+-- ping-pong frame order shared by every bullet (1->2->3->4->5->4->3->2->1)
+Bullet.animationSequence = {1, 2, 3, 4, 5, 4, 3, 2}
+
 function Bullet.loadSprites()
     if Bullet.sprites then
         return
@@ -46,7 +49,6 @@ function Bullet.new(x, y, vx, vy, maxBounces)
 
     -- animation
     self.animationSet = Bullet.animationSets[love.math.random(1, 4)]
-    self.animationSequence = {1, 2, 3, 4, 5, 4, 3, 2} --  (1->2->3->4->5->4->3->2->1)
     self.animationIndex = 1
     self.animationTimer = 0
     self.animationSpeed = 0.08 -- seconds per frame
@@ -64,7 +66,7 @@ function Bullet:update(dt, gameWidth, gameHeight)
     if self.animationTimer >= self.animationSpeed then
         self.animationTimer = self.animationTimer - self.animationSpeed
         self.animationIndex = self.animationIndex + 1
-        if self.animationIndex > #self.animationSequence then
+        if self.animationIndex > #Bullet.animationSequence then
             self.animationIndex = 1
         end
     end
@@ -108,7 +110,7 @@ function Bullet:draw()
         return
     end
 
-    local frameIndex = self.animationSequence[self.animationIndex]
+    local frameIndex = Bullet.animationSequence[self.animationIndex]
     local spriteIndex = self.animationSet[frameIndex]
     local sprite = Bullet.sprites[spriteIndex]
 
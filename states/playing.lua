@@ -57,16 +57,21 @@ function PlayingState:update(dt)
         table.insert(self.bullets, Bullet.new(ex, ey, vx, vy, self.currentMaxBounces))
     end
 
+    -- barrier state doesn't change while bullets update, so look it up once per frame
+    local barrierActive = self.barrier:isActive()
+    local centerX, centerY = self.barrier:getCenter()
+
+    local px, py, pw, ph = self.player:getCollisionBox()
+
     for i = #self.bullets, 1, -1 do
         local bullet = self.bullets[i]
         bullet:update(dt, VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
 
-        -- check barrier collision for bullets
-        if self.barrier:isActive() then
+        -- check barrier collision for bullets, skipping ones that just ran out of bounces
+        if barrierActive and bullet:isActive() then
             local bx, by, bw, bh = bullet:getCollisionBox()
             if self.barrier:checkCollision(bx, by, bw, bh) then
                 -- Bounce bullet away from barrier center
-                local centerX, centerY = self.barrier:getCenter()
                 local bulletCenterX = bx + bw / 2
                 local bulletCenterY = by + bh / 2
                 local dirX = bulletCenterX - centerX
@@ -81,17 +86,26 @@ function PlayingState:update(dt)
             end
         end
 
-        if not bullet:isActive() then
-            table.remove(self.bullets, i)
+        -- player hit check is done in the same pass as the update
+        if bullet:isActive() then
+            local bx, by, bw, bh = bullet:getCollisionBox()
+            if Collision.checkAABB(px, py, pw, ph, bx, by, bw, bh) then
+                return 'gameover'
+            end
+        else
+            -- swap with the last bullet instead of shifting the whole tail down,
+            -- the last slot was already updated since we iterate backwards
+            local last = #self.bullets
+            self.bullets[i] = self.bullets[last]
+            self.bullets[last] = nil
         end
     end
 
     -- check barrier collision for enemy
-    if self.barrier:isActive() then
+    if barrierActive then
         local ex, ey, ew, eh = self.enemy:getCollisionBox()
         if self.barrier:checkCollision(ex, ey, ew, eh) then
             -- Bounce enemy away from barrier center
-            local centerX, centerY = self.barrier:getCenter()
             local enemyCenterX = ex + ew / 2
             local enemyCenterY = ey + eh / 2
             local dirX = enemyCenterX - centerX
@@ -108,23 +122,11 @@ function PlayingState:update(dt)
         end
     end
 
-    local px, py, pw, ph = self.player:getCollisionBox()
-
     local ex, ey, ew, eh = self.enemy:getCollisionBox()
     if Collision.checkAABB(px, py, pw, ph, ex, ey, ew, eh) then
         return 'gameover'
     end
 
-    for _, bullet in ipairs(self.bullets) do
-        if bullet:isActive() then
-            local bx, by, bw, bh = bullet:getCollisionBox()
-
-            if Collision.checkAABB(px, py, pw, ph, bx, by, bw, bh) then
-                return 'gameover'
-            end
-        end
-    end
-
     return nil
 end
 